@@ -1,28 +1,75 @@
 # app.py
 
+import atexit
+from contextlib import contextmanager
+import csv
+import hashlib
+import io
 import os
-from flask import Flask, request, jsonify
+import random
+import time
+import uuid
+from functools import wraps
+from flask import Flask, request, jsonify, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from flask_compress import Compress
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.associationproxy import association_proxy
+from psycopg2.extras import execute_values
+from sqlalchemy.orm import selectinload
 from dotenv import load_dotenv
-from datetime import datetime
+import redis
+from datetime import date, datetime
+from werkzeug.http import http_date
+import orjson
 import logging
-
-# Initialize logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("spotify_data_api.log"),
-        logging.StreamHandler()
-    ]
+import logging.handlers
+import queue
+
+# Initialize logging: request threads only enqueue records, a background
+# listener does the file and stream writes
+log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+file_handler = logging.FileHandler("spotify_data_api.log")
+file_handler.setLevel(logging.WARNING)
+file_handler.setFormatter(log_formatter)
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(log_formatter)
+
+log_queue = queue.Queue(-1)
+# Attached directly rather than through basicConfig, which would give the
+# QueueHandler its own format and prefix every line twice
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+log_listener = logging.handlers.QueueListener(
+    log_queue, file_handler, stream_handler, respect_handler_level=True
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Load environment variables from .env
 load_dotenv()
 
+class OrjsonProvider(JSONProvider):
+    """Route jsonify and request.get_json through orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return dumps_json(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Skip the str round-trip of the base class and hand orjson's bytes straight over
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_json(obj), mimetype='application/json')
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Database configuration using separate environment variables
 DB_USER = os.getenv('DB_USER')
@@ -43,37 +90,219 @@ DATABASE_URL = f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_POR
 app.config['SQLALCHEMY_DATABASE_URI'] = DATABASE_URL
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
-# Initialize the database and migration engine
+# Connection pool sizing; DB_HOST may point at pgbouncer in transaction mode
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': int(os.getenv('DB_POOL_SIZE', '20')),
+    'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '40')),
+    'pool_pre_ping': True,
+    'pool_recycle': 1800
+}
+
+# Response compression, negotiated through Accept-Encoding
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+# Streamed list responses are compressed chunk by chunk, which Flask-Compress
+# cannot do with gzip, so they fall back to deflate
+app.config['COMPRESS_ALGORITHM_STREAMING'] = ['br', 'deflate']
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 500
+
+# Initialize the database, migration engine and compression
 db = SQLAlchemy(app)
 migrate = Migrate(app, db)
+compress = Compress(app)
+
+# Number of rows packed into each multi-row INSERT by the batch endpoints
+BULK_INSERT_PAGE_SIZE = 500
+
+# Number of rows fetched per server-side cursor round-trip by the list endpoints
+STREAM_BATCH_SIZE = 1000
+
+# Redis cache configuration
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+CACHE_KEY_PREFIX = 'v1'
+
+redis_pool = redis.ConnectionPool.from_url(REDIS_URL)
+cache = redis.Redis(connection_pool=redis_pool)
+
+# Caching
+
+def cached(ttl, tag):
+    """Cache-aside for GET views: serve from Redis, else store the view's 200 response."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            version_key = f"{CACHE_KEY_PREFIX}:version:{tag}"
+            try:
+                pipe = cache.pipeline()
+                pipe.set(version_key, time.time_ns(), nx=True)
+                pipe.get(version_key)
+                version = pipe.execute()[1].decode()
+                # Bodies are keyed by the version they were read under, so a miss
+                # still in flight during a write can never be served as current
+                key = f"{CACHE_KEY_PREFIX}:{tag}:{version}:{request.full_path}"
+                body = cache.get(key)
+            except redis.RedisError as e:
+                logger.warning(f"Cache lookup failed for {tag}: {e}")
+                return view(*args, **kwargs)
+
+            # The ETag follows the tag's last mutation, so it is known before the body exists
+            etag = hashlib.blake2b(f"{version}:{request.full_path}".encode(), digest_size=16).hexdigest()
+            if etag_matches(etag):
+                response = app.response_class(status=304)
+                response.set_etag(etag)
+                return response
+
+            if body is not None:
+                response = app.response_class(body, status=200, mimetype='application/json')
+                response.headers['X-Cache'] = 'HIT'
+                response.set_etag(etag)
+                return response
+
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                response.set_etag(etag)
+                if response.is_streamed:
+                    response.response = cache_stream(response.response, key, tag, ttl)
+                else:
+                    try:
+                        pipe = cache.pipeline()
+                        pipe.set(key, response.get_data())
+                        publish_cached(pipe, key, tag, ttl)
+                    except redis.RedisError as e:
+                        logger.warning(f"Cache store failed for {key}: {e}")
+            response.headers['X-Cache'] = 'MISS'
+            return response
+        return wrapper
+    return decorator
+
+def etag_matches(etag):
+    # Flask-Compress suffixes the ETag with the encoding, e.g. "<etag>:br"
+    return any(
+        candidate == etag or candidate.startswith(f"{etag}:")
+        for candidate in request.if_none_match.as_set()
+    )
+
+def publish_cached(pipe, key, tag, ttl):
+    # Jitter the TTL so keys written together do not expire together
+    tag_key = f"{CACHE_KEY_PREFIX}:tag:{tag}"
+    pipe.expire(key, max(1, int(ttl * random.uniform(0.8, 1.0))))
+    pipe.sadd(tag_key, key)
+    # Members never outlive ttl, so the set can expire with the newest one
+    pipe.expire(tag_key, ttl)
+    pipe.execute()
+
+def cache_stream(chunks, key, tag, ttl):
+    """Pass a streamed body through while appending it to Redis chunk by chunk.
+
+    The body goes to a scratch key and is only renamed into place once the
+    stream completes, so an aborted or failed response is never served.
+    """
+    scratch_key = f"{key}:partial:{uuid.uuid4().hex}"
+    storing = True
+    published = False
+    try:
+        for chunk in chunks:
+            if storing:
+                try:
+                    pipe = cache.pipeline()
+                    pipe.append(scratch_key, chunk)
+                    pipe.expire(scratch_key, ttl)
+                    pipe.execute()
+                except redis.RedisError as e:
+                    logger.warning(f"Cache store failed for {key}: {e}")
+                    storing = False
+            yield chunk
+        if storing:
+            try:
+                pipe = cache.pipeline()
+                pipe.rename(scratch_key, key)
+                publish_cached(pipe, key, tag, ttl)
+                published = True
+            except redis.RedisError as e:
+                logger.warning(f"Cache store failed for {key}: {e}")
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+        if storing and not published:
+            try:
+                cache.delete(scratch_key)
+            except redis.RedisError as e:
+                logger.warning(f"Cache cleanup failed for {scratch_key}: {e}")
+
+def invalidate_cache(*tags):
+    """Retire every cached response registered under the given tags."""
+    try:
+        for tag in tags:
+            # Bumping the version is what invalidates: it changes every body key and
+            # ETag under this tag. Deleting the old bodies below only frees memory early
+            cache.set(f"{CACHE_KEY_PREFIX}:version:{tag}", time.time_ns())
+            tag_key = f"{CACHE_KEY_PREFIX}:tag:{tag}"
+            keys = cache.smembers(tag_key)
+            if keys:
+                pipe = cache.pipeline()
+                pipe.delete(*keys)
+                pipe.srem(tag_key, *keys)
+                pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Cache invalidation failed for {tags}: {e}")
 
 # Define Models
 
+# Spotify IDs are 22-character base62 strings
+SPOTIFY_ID_LENGTH = 22
+
+artist_genres = db.Table(
+    'artist_genres',
+    db.Column('artist_id', db.String(SPOTIFY_ID_LENGTH), db.ForeignKey('artists.id'), primary_key=True),
+    db.Column('genre_id', db.Integer, db.ForeignKey('genres.id'), primary_key=True, index=True)
+)
+
+class Genre(db.Model):
+    __tablename__ = 'genres'
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String, nullable=False, unique=True)
+
+    @classmethod
+    def get_or_create(cls, name):
+        # Insert-or-skip first, like the batch path, so concurrent requests
+        # adding the same new genre do not trip the unique constraint
+        db.session.execute(pg_insert(cls.__table__).values(name=name).on_conflict_do_nothing(index_elements=['name']))
+        return db.session.execute(select(cls).where(cls.name == name)).scalar_one()
+
 class Artist(db.Model):
     __tablename__ = 'artists'
-    id = db.Column(db.String, primary_key=True)
+    __table_args__ = (
+        db.Index('ix_artists_popularity', db.text('popularity DESC')),
+    )
+    id = db.Column(db.String(SPOTIFY_ID_LENGTH), primary_key=True)
     name = db.Column(db.String, nullable=False)
-    genres = db.Column(db.String)
     popularity = db.Column(db.Integer)
     followers = db.Column(db.Integer)
     uri = db.Column(db.String)
 
-    albums = db.relationship('Album', backref='artist', lazy=True)
+    # lazy='raise' forces callers to pick a loader strategy explicitly
+    albums = db.relationship('Album', back_populates='artist', lazy='raise')
+    genres = db.relationship('Genre', secondary=artist_genres, order_by='Genre.name', lazy='raise')
+    genre_names = association_proxy('genres', 'name', creator=Genre.get_or_create)
 
-    def to_dict(self):
-        return {
+    def to_dict(self, expand=False):
+        output = {
             'id': self.id,
             'name': self.name,
-            'genres': self.genres,
+            'genres': list(self.genre_names),
             'popularity': self.popularity,
             'followers': self.followers,
             'uri': self.uri
         }
+        if expand:
+            output['albums'] = [album.to_dict(expand=True) for album in self.albums]
+        return output
 
 class Album(db.Model):
     __tablename__ = 'albums'
-    id = db.Column(db.String, primary_key=True)
-    artist_id = db.Column(db.String, db.ForeignKey('artists.id'), nullable=False)
+    id = db.Column(db.String(SPOTIFY_ID_LENGTH), primary_key=True)
+    artist_id = db.Column(db.String(SPOTIFY_ID_LENGTH), db.ForeignKey('artists.id'), nullable=False, index=True)
     name = db.Column(db.String, nullable=False)
     album_type = db.Column(db.String)
     release_date = db.Column(db.Date)
@@ -81,10 +310,11 @@ class Album(db.Model):
     total_tracks = db.Column(db.Integer)
     uri = db.Column(db.String)
 
-    tracks = db.relationship('Track', backref='album', lazy=True)
+    artist = db.relationship('Artist', back_populates='albums', lazy='raise')
+    tracks = db.relationship('Track', back_populates='album', lazy='raise')
 
-    def to_dict(self):
-        return {
+    def to_dict(self, expand=False):
+        output = {
             'id': self.id,
             'artist_id': self.artist_id,
             'name': self.name,
@@ -94,11 +324,14 @@ class Album(db.Model):
             'total_tracks': self.total_tracks,
             'uri': self.uri
         }
+        if expand:
+            output['tracks'] = [track.to_dict() for track in self.tracks]
+        return output
 
 class Track(db.Model):
     __tablename__ = 'tracks'
-    id = db.Column(db.String, primary_key=True)
-    album_id = db.Column(db.String, db.ForeignKey('albums.id'), nullable=False)
+    id = db.Column(db.String(SPOTIFY_ID_LENGTH), primary_key=True)
+    album_id = db.Column(db.String(SPOTIFY_ID_LENGTH), db.ForeignKey('albums.id'), nullable=False, index=True)
     name = db.Column(db.String, nullable=False)
     track_number = db.Column(db.Integer)
     duration_ms = db.Column(db.Integer)
@@ -106,6 +339,8 @@ class Track(db.Model):
     uri = db.Column(db.String)
     is_local = db.Column(db.Boolean)
 
+    album = db.relationship('Album', back_populates='tracks', lazy='raise')
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -118,6 +353,93 @@ class Track(db.Model):
             'is_local': self.is_local
         }
 
+# Prebuilt statements: built once at import so the hot path reuses the same
+# objects and SQLAlchemy's compiled cache hits without rebuilding them per request
+
+# Genre names for each artist as a Postgres array, so row queries need no ORM loading
+ARTIST_GENRE_NAMES = func.array(
+    select(Genre.name)
+    .join(artist_genres, artist_genres.c.genre_id == Genre.id)
+    .where(artist_genres.c.artist_id == Artist.id)
+    .order_by(Genre.name)
+    .scalar_subquery()
+).label('genres')
+ARTISTS_IN_GENRE = Artist.id.in_(
+    select(artist_genres.c.artist_id)
+    .join(Genre, Genre.id == artist_genres.c.genre_id)
+    .where(Genre.name == bindparam('genre'))
+)
+
+ARTISTS_STMT = select(*Artist.__table__.columns, ARTIST_GENRE_NAMES)
+ARTISTS_BY_GENRE_STMT = ARTISTS_STMT.where(ARTISTS_IN_GENRE)
+ARTISTS_EXPANDED_STMT = select(Artist).options(
+    selectinload(Artist.genres),
+    selectinload(Artist.albums).selectinload(Album.tracks)
+)
+ARTISTS_EXPANDED_BY_GENRE_STMT = ARTISTS_EXPANDED_STMT.where(ARTISTS_IN_GENRE)
+ARTIST_BY_ID_STMT = ARTISTS_STMT.where(Artist.id == bindparam('id'))
+
+# Artist with its albums and their tracks, assembled as one JSON document by Postgres.
+# Cast to text so psycopg2 hands back the serialized string instead of parsing it.
+# release_date is formatted like json_default's http_date so both paths agree
+ARTIST_FULL_STMT = db.text("""
+    SELECT jsonb_build_object(
+        'id', a.id,
+        'name', a.name,
+        'genres', ARRAY(
+            SELECT g.name FROM genres g
+            JOIN artist_genres ag ON ag.genre_id = g.id
+            WHERE ag.artist_id = a.id
+            ORDER BY g.name
+        ),
+        'popularity', a.popularity,
+        'followers', a.followers,
+        'uri', a.uri,
+        'albums', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', al.id,
+                'artist_id', al.artist_id,
+                'name', al.name,
+                'album_type', al.album_type,
+                'release_date', to_char(al.release_date, 'Dy, DD Mon YYYY "00:00:00 GMT"'),
+                'release_date_precision', al.release_date_precision,
+                'total_tracks', al.total_tracks,
+                'uri', al.uri,
+                'tracks', COALESCE((
+                    SELECT jsonb_agg(to_jsonb(t) ORDER BY t.track_number, t.id)
+                    FROM tracks t WHERE t.album_id = al.id
+                ), '[]'::jsonb)
+            ) ORDER BY al.release_date, al.id)
+            FROM albums al WHERE al.artist_id = a.id
+        ), '[]'::jsonb)
+    )::text
+    FROM artists a
+    WHERE a.id = :id
+""")
+
+ALBUMS_STMT = select(Album.__table__)
+ALBUMS_EXPANDED_STMT = select(Album).options(selectinload(Album.tracks))
+ALBUM_BY_ID_STMT = select(Album.__table__).where(Album.id == bindparam('id'))
+
+TRACKS_STMT = select(Track.__table__)
+TRACK_BY_ID_STMT = select(Track.__table__).where(Track.id == bindparam('id'))
+
+# HTTP caching
+
+@app.after_request
+def add_etag(response):
+    # Lets clients and CDNs revalidate with If-None-Match and get an empty 304
+    if request.method != 'GET' or response.status_code not in (200, 304):
+        return response
+    response.headers['Cache-Control'] = 'public, max-age=60, stale-while-revalidate=30'
+    # Hashing or sizing a streamed body would pull it all into memory; cached
+    # views already answered If-None-Match from their version-based ETag
+    if response.is_streamed:
+        return response
+    if response.status_code == 200 and response.get_etag()[0] is None:
+        response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+    return response.make_conditional(request)
+
 # Routes
 
 @app.route('/')
@@ -137,13 +459,14 @@ def add_artist():
         artist = Artist(
             id=data.get('id'),
             name=data.get('name'),
-            genres=data.get('genres'),
             popularity=data.get('popularity'),
             followers=data.get('followers'),
             uri=data.get('uri')
         )
+        artist.genre_names = parse_genres(data.get('genres'))
         db.session.add(artist)
         db.session.commit()
+        invalidate_cache('artists')
         logger.info(f"Artist added successfully: {artist.name}")
         return jsonify({"message": "Artist added successfully"}), 201
     except Exception as e:
@@ -151,31 +474,85 @@ def add_artist():
         logger.error(f"Error adding artist: {e}")
         return jsonify({"error": str(e)}), 400
 
+@app.route('/artists:batch', methods=['POST'])
+def add_artists_bulk():
+    data = request.get_json()
+    if not data or not isinstance(data, list):
+        logger.warning("No input list provided for adding artists in bulk.")
+        return jsonify({"error": "Expected a non-empty JSON array"}), 400
+
+    try:
+        rows = artist_rows(data)
+        with raw_cursor() as cursor:
+            inserted = bulk_insert(cursor, Artist, rows)
+            # Artists skipped as duplicates keep their stored genres. Within the batch
+            # the first row for an id is the one inserted, so only it gets linked
+            linked = {}
+            for row in rows:
+                if row['id'] in inserted:
+                    linked.setdefault(row['id'], row)
+            bulk_insert_artist_genres(cursor, list(linked.values()))
+        invalidate_cache('artists')
+        logger.info(f"Artists added successfully: {len(inserted)} inserted, {len(rows) - len(inserted)} skipped")
+        return jsonify({
+            "message": "Artists added successfully",
+            "inserted": len(inserted),
+            "skipped": len(rows) - len(inserted)
+        }), 201
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error adding artists in bulk: {e}")
+        return jsonify({"error": str(e)}), 400
+
 @app.route('/artists', methods=['GET'])
+@cached(ttl=300, tag='artists')
 def get_artists():
     try:
-        artists = Artist.query.all()
-        output = [artist.to_dict() for artist in artists]
+        expand = request.args.get('expand') == 'true'
+        genre = request.args.get('genre')
+        params = {'genre': genre} if genre else None
+        if expand:
+            stmt = ARTISTS_EXPANDED_BY_GENRE_STMT if genre else ARTISTS_EXPANDED_STMT
+            batches = model_batches(stmt, params)
+        else:
+            stmt = ARTISTS_BY_GENRE_STMT if genre else ARTISTS_STMT
+            batches = row_batches(stmt, params)
         logger.info("Fetched all artists successfully.")
-        return jsonify(output), 200
+        return stream_json_array(batches), 200
     except Exception as e:
         logger.error(f"Error fetching artists: {e}")
         return jsonify({"error": str(e)}), 500
 
 @app.route('/artists/<id>', methods=['GET'])
+@cached(ttl=300, tag='artists')
 def get_artist(id):
     try:
-        artist = Artist.query.get(id)
+        artist = db.session.execute(ARTIST_BY_ID_STMT, {'id': id}).first()
         if not artist:
             logger.warning(f"Artist not found: {id}")
             return jsonify({"error": "Artist not found"}), 404
 
         logger.info(f"Fetched artist: {artist.name}")
-        return jsonify(artist.to_dict()), 200
+        return jsonify(artist._asdict()), 200
     except Exception as e:
         logger.error(f"Error fetching artist {id}: {e}")
         return jsonify({"error": str(e)}), 500
 
+@app.route('/artists/<id>/full', methods=['GET'])
+@cached(ttl=300, tag='artists')
+def get_artist_full(id):
+    try:
+        body = db.session.execute(ARTIST_FULL_STMT, {'id': id}).scalar()
+        if body is None:
+            logger.warning(f"Artist not found: {id}")
+            return jsonify({"error": "Artist not found"}), 404
+
+        logger.info(f"Fetched full artist: {id}")
+        return app.response_class(body, mimetype='application/json'), 200
+    except Exception as e:
+        logger.error(f"Error fetching full artist {id}: {e}")
+        return jsonify({"error": str(e)}), 500
+
 # CRUD operations for Albums
 
 @app.route('/albums', methods=['POST'])
@@ -199,6 +576,7 @@ def add_album():
         )
         db.session.add(album)
         db.session.commit()
+        invalidate_cache('albums', 'artists')
         logger.info(f"Album added successfully: {album.name}")
         return jsonify({"message": "Album added successfully"}), 201
     except Exception as e:
@@ -206,27 +584,55 @@ def add_album():
         logger.error(f"Error adding album: {e}")
         return jsonify({"error": str(e)}), 400
 
+@app.route('/albums:batch', methods=['POST'])
+def add_albums_bulk():
+    data = request.get_json()
+    if not data or not isinstance(data, list):
+        logger.warning("No input list provided for adding albums in bulk.")
+        return jsonify({"error": "Expected a non-empty JSON array"}), 400
+
+    try:
+        rows = album_rows(data)
+        with raw_cursor() as cursor:
+            inserted = bulk_insert(cursor, Album, rows)
+        invalidate_cache('albums', 'artists')
+        logger.info(f"Albums added successfully: {len(inserted)} inserted, {len(rows) - len(inserted)} skipped")
+        return jsonify({
+            "message": "Albums added successfully",
+            "inserted": len(inserted),
+            "skipped": len(rows) - len(inserted)
+        }), 201
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error adding albums in bulk: {e}")
+        return jsonify({"error": str(e)}), 400
+
 @app.route('/albums', methods=['GET'])
+@cached(ttl=300, tag='albums')
 def get_albums():
     try:
-        albums = Album.query.all()
-        output = [album.to_dict() for album in albums]
+        expand = request.args.get('expand') == 'true'
+        if expand:
+            batches = model_batches(ALBUMS_EXPANDED_STMT)
+        else:
+            batches = row_batches(ALBUMS_STMT)
         logger.info("Fetched all albums successfully.")
-        return jsonify(output), 200
+        return stream_json_array(batches), 200
     except Exception as e:
         logger.error(f"Error fetching albums: {e}")
         return jsonify({"error": str(e)}), 500
 
 @app.route('/albums/<id>', methods=['GET'])
+@cached(ttl=300, tag='albums')
 def get_album(id):
     try:
-        album = Album.query.get(id)
+        album = db.session.execute(ALBUM_BY_ID_STMT, {'id': id}).first()
         if not album:
             logger.warning(f"Album not found: {id}")
             return jsonify({"error": "Album not found"}), 404
 
         logger.info(f"Fetched album: {album.name}")
-        return jsonify(album.to_dict()), 200
+        return jsonify(album._asdict()), 200
     except Exception as e:
         logger.error(f"Error fetching album {id}: {e}")
         return jsonify({"error": str(e)}), 500
@@ -253,6 +659,7 @@ def add_track():
         )
         db.session.add(track)
         db.session.commit()
+        invalidate_cache('tracks', 'albums', 'artists')
         logger.info(f"Track added successfully: {track.name}")
         return jsonify({"message": "Track added successfully"}), 201
     except Exception as e:
@@ -260,46 +667,251 @@ def add_track():
         logger.error(f"Error adding track: {e}")
         return jsonify({"error": str(e)}), 400
 
+@app.route('/tracks:batch', methods=['POST'])
+def add_tracks_bulk():
+    data = request.get_json()
+    if not data or not isinstance(data, list):
+        logger.warning("No input list provided for adding tracks in bulk.")
+        return jsonify({"error": "Expected a non-empty JSON array"}), 400
+
+    try:
+        rows = track_rows(data)
+        with raw_cursor() as cursor:
+            inserted = bulk_insert(cursor, Track, rows)
+        invalidate_cache('tracks', 'albums', 'artists')
+        logger.info(f"Tracks added successfully: {len(inserted)} inserted, {len(rows) - len(inserted)} skipped")
+        return jsonify({
+            "message": "Tracks added successfully",
+            "inserted": len(inserted),
+            "skipped": len(rows) - len(inserted)
+        }), 201
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error adding tracks in bulk: {e}")
+        return jsonify({"error": str(e)}), 400
+
 @app.route('/tracks', methods=['GET'])
+@cached(ttl=60, tag='tracks')
 def get_tracks():
     try:
-        tracks = Track.query.all()
-        output = [track.to_dict() for track in tracks]
+        batches = row_batches(TRACKS_STMT)
         logger.info("Fetched all tracks successfully.")
-        return jsonify(output), 200
+        return stream_json_array(batches), 200
     except Exception as e:
         logger.error(f"Error fetching tracks: {e}")
         return jsonify({"error": str(e)}), 500
 
 @app.route('/tracks/<id>', methods=['GET'])
+@cached(ttl=60, tag='tracks')
 def get_track(id):
     try:
-        track = Track.query.get(id)
+        track = db.session.execute(TRACK_BY_ID_STMT, {'id': id}).first()
         if not track:
             logger.warning(f"Track not found: {id}")
             return jsonify({"error": "Track not found"}), 404
 
         logger.info(f"Fetched track: {track.name}")
-        return jsonify(track.to_dict()), 200
+        return jsonify(track._asdict()), 200
     except Exception as e:
         logger.error(f"Error fetching track {id}: {e}")
         return jsonify({"error": str(e)}), 500
 
 # Utility Functions
 
+def artist_rows(data):
+    return [
+        {
+            'id': item.get('id'),
+            'name': item.get('name'),
+            'genres': parse_genres(item.get('genres')),
+            'popularity': item.get('popularity'),
+            'followers': item.get('followers'),
+            'uri': item.get('uri')
+        }
+        for item in data
+    ]
+
+def album_rows(data):
+    return [
+        {
+            'id': item.get('id'),
+            'artist_id': item.get('artist_id'),
+            'name': item.get('name'),
+            'album_type': item.get('album_type'),
+            'release_date': parse_release_date(item.get('release_date')),
+            'release_date_precision': item.get('release_date_precision'),
+            'total_tracks': item.get('total_tracks'),
+            'uri': item.get('uri')
+        }
+        for item in data
+    ]
+
+def track_rows(data):
+    return [
+        {
+            'id': item.get('id'),
+            'album_id': item.get('album_id'),
+            'name': item.get('name'),
+            'track_number': item.get('track_number'),
+            'duration_ms': item.get('duration_ms'),
+            'explicit': item.get('explicit'),
+            'uri': item.get('uri'),
+            'is_local': item.get('is_local')
+        }
+        for item in data
+    ]
+
+@contextmanager
+def raw_cursor():
+    # psycopg2 cursor on a pooled connection, committed once when the block exits
+    conn = db.engine.raw_connection()
+    try:
+        yield conn.cursor()
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+def bulk_insert(cursor, model, rows):
+    # execute_values sends one INSERT ... VALUES (...),(...) per page instead of one per row
+    columns = [column.name for column in model.__table__.columns]
+    sql = (
+        f"INSERT INTO {model.__tablename__} ({', '.join(columns)}) VALUES %s "
+        "ON CONFLICT (id) DO NOTHING RETURNING id"
+    )
+    values = [tuple(row.get(column) for column in columns) for row in rows]
+    # Rows skipped by ON CONFLICT return nothing, so this is what was actually inserted
+    inserted = execute_values(cursor, sql, values, page_size=BULK_INSERT_PAGE_SIZE, fetch=True)
+    return {row[0] for row in inserted}
+
+def copy_rows(cursor, model, rows):
+    # COPY skips per-row parse/plan entirely; meant for initial loads, so an
+    # existing id fails the whole load rather than being skipped
+    columns = [column.name for column in model.__table__.columns]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([row.get(column) for column in columns])
+    buffer.seek(0)
+    cursor.copy_expert(
+        f"COPY {model.__tablename__} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '')",
+        buffer
+    )
+
+def bulk_insert_artist_genres(cursor, rows):
+    pairs = [(row['id'], name) for row in rows for name in row['genres']]
+    if not pairs:
+        return
+    execute_values(
+        cursor,
+        "INSERT INTO genres (name) VALUES %s ON CONFLICT (name) DO NOTHING",
+        [(name,) for name in {name for _, name in pairs}],
+        page_size=BULK_INSERT_PAGE_SIZE
+    )
+    execute_values(
+        cursor,
+        "INSERT INTO artist_genres (artist_id, genre_id) "
+        "SELECT v.artist_id, g.id FROM (VALUES %s) AS v (artist_id, name) "
+        "JOIN genres g ON g.name = v.name "
+        "ON CONFLICT DO NOTHING",
+        pairs,
+        page_size=BULK_INSERT_PAGE_SIZE
+    )
+
+def parse_genres(value):
+    # Accept a JSON list or the legacy comma-delimited string; drop blanks and duplicates
+    if not value:
+        return []
+    names = value.split(',') if isinstance(value, str) else value
+    return list(dict.fromkeys(name.strip() for name in names if name and name.strip()))
+
+def json_default(value):
+    # Match Flask's default provider so dates keep their HTTP-date format
+    if isinstance(value, (date, datetime)):
+        return http_date(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps_json(obj):
+    return orjson.dumps(obj, default=json_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+
+def row_batches(stmt, params=None):
+    # Plain column rows skip ORM instrumentation entirely
+    result = db.session.execute(stmt.execution_options(yield_per=STREAM_BATCH_SIZE), params)
+    return ([row._asdict() for row in partition] for partition in result.partitions())
+
+def model_batches(stmt, params=None):
+    result = db.session.execute(stmt.execution_options(yield_per=STREAM_BATCH_SIZE), params).scalars()
+    return ([obj.to_dict(expand=True) for obj in partition] for partition in result.partitions())
+
+def stream_json_array(batches):
+    # Emit a JSON array batch by batch so the full list is never held in memory
+    def generate():
+        yield b'['
+        first = True
+        try:
+            for batch in batches:
+                if not batch:
+                    continue
+                if not first:
+                    yield b','
+                # Strip the brackets so each batch splices into the outer array
+                yield dumps_json(batch)[1:-1]
+                first = False
+        except Exception as e:
+            # Headers are already sent, so the client only sees a truncated body
+            logger.error(f"Error streaming {request.path}: {e}")
+            raise
+        yield b']'
+    return app.response_class(stream_with_context(generate()), mimetype='application/json')
+
+# Spotify release dates come at year, month or day precision
+RELEASE_DATE_FORMATS = {4: "%Y", 7: "%Y-%m", 10: "%Y-%m-%d"}
+
 def parse_release_date(date_str):
+    fmt = RELEASE_DATE_FORMATS.get(len(date_str)) if isinstance(date_str, str) else None
+    if fmt is None:
+        return None
     try:
-        if len(date_str) == 4:
-            return datetime.strptime(date_str, "%Y").date()
-        elif len(date_str) == 7:
-            return datetime.strptime(date_str, "%Y-%m").date()
-        elif len(date_str) == 10:
-            return datetime.strptime(date_str, "%Y-%m-%d").date()
-        else:
-            return None
-    except Exception as e:
+        return datetime.strptime(date_str, fmt).date()
+    except ValueError as e:
         logger.error(f"Error parsing release date '{date_str}': {e}")
         return None
 
+# Bulk loading
+
+# Resource -> (model, row builder, cache tags to invalidate)
+LOADERS = {
+    'artists': (Artist, artist_rows, ('artists',)),
+    'albums': (Album, album_rows, ('albums', 'artists')),
+    'tracks': (Track, track_rows, ('tracks', 'albums', 'artists'))
+}
+
+@app.route('/load/<resource>', methods=['POST'])
+def load_resource(resource):
+    if resource not in LOADERS:
+        logger.warning(f"Unknown resource for bulk load: {resource}")
+        return jsonify({"error": "Unknown resource"}), 404
+
+    data = request.get_json()
+    if not data or not isinstance(data, list):
+        logger.warning(f"No input list provided for loading {resource}.")
+        return jsonify({"error": "Expected a non-empty JSON array"}), 400
+
+    model, build_rows, tags = LOADERS[resource]
+    try:
+        rows = build_rows(data)
+        with raw_cursor() as cursor:
+            copy_rows(cursor, model, rows)
+            if model is Artist:
+                bulk_insert_artist_genres(cursor, rows)
+        invalidate_cache(*tags)
+        logger.info(f"Loaded {len(rows)} rows into {resource}")
+        return jsonify({"message": f"Loaded {resource} successfully", "count": len(rows)}), 201
+    except Exception as e:
+        logger.error(f"Error loading {resource}: {e}")
+        return jsonify({"error": str(e)}), 400
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0',port='8080', ssl_context=('cert.pem', 'privkey.pem'))
@@ -0,0 +1,35 @@
+# gunicorn.conf.py
+#
+# gunicorn -c gunicorn.conf.py app:app
+
+import multiprocessing
+import os
+
+# Every worker has its own SQLAlchemy pool, so one connection budget is split
+# across them. Keep it under Postgres' max_connections (100 by default), or
+# raise it when DB_HOST points at pgbouncer.
+DB_CONNECTION_BUDGET = int(os.getenv('DB_CONNECTION_BUDGET', '90'))
+
+# Streamed list downloads hold a pooled connection until the client finishes,
+# so each worker needs room for several at once
+MIN_CONNECTIONS_PER_WORKER = 10
+
+bind = '0.0.0.0:8080'
+# gevent multiplexes I/O inside each worker, so one per core is enough; fewer
+# when the budget cannot give every worker its minimum share
+workers = max(1, min(multiprocessing.cpu_count(), DB_CONNECTION_BUDGET // MIN_CONNECTIONS_PER_WORKER))
+worker_class = 'gevent'
+worker_connections = 1000
+
+certfile = 'cert.pem'
+keyfile = 'privkey.pem'
+
+# A steady pool plus some overflow for bursts, together within the worker's share
+connections_per_worker = DB_CONNECTION_BUDGET // workers
+os.environ.setdefault('DB_MAX_OVERFLOW', str(connections_per_worker // 4))
+os.environ.setdefault('DB_POOL_SIZE', str(connections_per_worker - connections_per_worker // 4))
+
+def post_fork(server, worker):
+    # Make psycopg2 yield to the gevent hub while waiting on Postgres
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
@@ -0,0 +1,65 @@
+"""baseline schema
+
+Revision ID: a1c4e2f0b7d1
+Revises: 
+Create Date: 2026-10-15 21:55:00.000000
+
+Tables as they existed before migrations were tracked. Databases created
+before then already have them: run `flask db stamp a1c4e2f0b7d1` once
+instead of upgrading through this revision.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1c4e2f0b7d1'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'artists',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('genres', sa.String(), nullable=True),
+        sa.Column('popularity', sa.Integer(), nullable=True),
+        sa.Column('followers', sa.Integer(), nullable=True),
+        sa.Column('uri', sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'albums',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('artist_id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('album_type', sa.String(), nullable=True),
+        sa.Column('release_date', sa.Date(), nullable=True),
+        sa.Column('release_date_precision', sa.String(), nullable=True),
+        sa.Column('total_tracks', sa.Integer(), nullable=True),
+        sa.Column('uri', sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(['artist_id'], ['artists.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'tracks',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('album_id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('track_number', sa.Integer(), nullable=True),
+        sa.Column('duration_ms', sa.Integer(), nullable=True),
+        sa.Column('explicit', sa.Boolean(), nullable=True),
+        sa.Column('uri', sa.String(), nullable=True),
+        sa.Column('is_local', sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(['album_id'], ['albums.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('tracks')
+    op.drop_table('albums')
+    op.drop_table('artists')
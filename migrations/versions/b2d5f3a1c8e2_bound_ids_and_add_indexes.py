@@ -0,0 +1,47 @@
+"""bound spotify ids and add lookup indexes
+
+Revision ID: b2d5f3a1c8e2
+Revises: a1c4e2f0b7d1
+Create Date: 2026-10-15 21:56:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2d5f3a1c8e2'
+down_revision = 'a1c4e2f0b7d1'
+branch_labels = None
+depends_on = None
+
+ID_COLUMNS = [
+    ('artists', 'id'),
+    ('albums', 'id'),
+    ('albums', 'artist_id'),
+    ('tracks', 'id'),
+    ('tracks', 'album_id'),
+]
+
+
+def upgrade():
+    for table, column in ID_COLUMNS:
+        op.alter_column(table, column, type_=sa.String(22), existing_type=sa.String(), existing_nullable=False)
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_albums_artist_id', 'albums', ['artist_id'], postgresql_concurrently=True)
+        op.create_index('ix_tracks_album_id', 'tracks', ['album_id'], postgresql_concurrently=True)
+        op.create_index(
+            'ix_artists_popularity', 'artists', [sa.text('popularity DESC')], postgresql_concurrently=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_artists_popularity', table_name='artists', postgresql_concurrently=True)
+        op.drop_index('ix_tracks_album_id', table_name='tracks', postgresql_concurrently=True)
+        op.drop_index('ix_albums_artist_id', table_name='albums', postgresql_concurrently=True)
+
+    for table, column in ID_COLUMNS:
+        op.alter_column(table, column, type_=sa.String(), existing_type=sa.String(22), existing_nullable=False)
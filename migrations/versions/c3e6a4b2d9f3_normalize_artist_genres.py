@@ -0,0 +1,76 @@
+"""normalize artist genres into genres and artist_genres
+
+Revision ID: c3e6a4b2d9f3
+Revises: b2d5f3a1c8e2
+Create Date: 2026-10-15 21:58:00.000000
+
+Existing artists.genres values are comma-delimited strings. They are split
+and trimmed the same way the API's parse_genres() does before the column
+is dropped.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e6a4b2d9f3'
+down_revision = 'b2d5f3a1c8e2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'genres',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+    )
+    op.create_table(
+        'artist_genres',
+        sa.Column('artist_id', sa.String(22), nullable=False),
+        sa.Column('genre_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['artist_id'], ['artists.id']),
+        sa.ForeignKeyConstraint(['genre_id'], ['genres.id']),
+        sa.PrimaryKeyConstraint('artist_id', 'genre_id')
+    )
+    op.create_index('ix_artist_genres_genre_id', 'artist_genres', ['genre_id'])
+
+    op.execute("""
+        INSERT INTO genres (name)
+        SELECT DISTINCT btrim(g.name)
+        FROM artists a
+        CROSS JOIN LATERAL unnest(string_to_array(a.genres, ',')) AS g (name)
+        WHERE btrim(g.name) <> ''
+        ORDER BY 1
+    """)
+    op.execute("""
+        INSERT INTO artist_genres (artist_id, genre_id)
+        SELECT DISTINCT a.id, ge.id
+        FROM artists a
+        CROSS JOIN LATERAL unnest(string_to_array(a.genres, ',')) AS g (name)
+        JOIN genres ge ON ge.name = btrim(g.name)
+    """)
+
+    op.drop_column('artists', 'genres')
+
+
+def downgrade():
+    op.add_column('artists', sa.Column('genres', sa.String(), nullable=True))
+    op.execute("""
+        UPDATE artists a
+        SET genres = agg.names
+        FROM (
+            SELECT ag.artist_id, string_agg(ge.name, ',' ORDER BY ge.name) AS names
+            FROM artist_genres ag
+            JOIN genres ge ON ge.id = ag.genre_id
+            GROUP BY ag.artist_id
+        ) AS agg
+        WHERE agg.artist_id = a.id
+    """)
+
+    op.drop_index('ix_artist_genres_genre_id', table_name='artist_genres')
+    op.drop_table('artist_genres')
+    op.drop_table('genres')